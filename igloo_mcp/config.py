@@ -63,6 +63,12 @@ class Config(BaseSettings):
         le=1000,
         description="The number of results to fetch per page for paginated results.",
     )
+    max_concurrent_requests: int = Field(
+        default=8,
+        ge=1,
+        le=64,
+        description="The maximum number of concurrent requests to the Igloo API, e.g. when fetching search result pages in parallel.",
+    )
     default_limit: int = Field(
         default=20,
         ge=1,
@@ -95,7 +101,7 @@ class Config(BaseSettings):
         default=15.0,
         ge=5.0,
         le=120.0,
-        description="Timeout in seconds for fetch requests.",
+        description="Timeout in seconds for fetch requests. Also applies to search API requests.",
     )
     fetch_max_pages: int = Field(
         default=5,
@@ -7,6 +7,15 @@ if TYPE_CHECKING:
     from igloo_mcp.converter import TruncationMetadata
 
 
+# Line separating the header and each entry in search results output
+_RESULT_SEPARATOR = "----------"
+_RESULT_JOINER = f"\n{_RESULT_SEPARATOR}\n"
+
+# Fixed lines of the truncation notice appended to fetch output
+_TRUNCATION_BANNER = ("", "---", "", "⚠️ CONTENT TRUNCATED")
+_CONTINUATION_HINT = "To continue reading, call fetch with start_index:"
+
+
 def format_search_results(
     results: list[dict[str, Any]],
     search_params: dict[str, Any],
@@ -28,15 +37,9 @@ def format_search_results(
     if not results:
         return f"{header}\n\nNo results found."
     
-    formatted_results = [header]
-    
-    for result in results:
-        formatted_results.append("\n----------\n")
-        formatted_results.append(_format_single_result(result))
-    
-    formatted_results.append("\n----------")
-    
-    return "".join(formatted_results)
+    body = _RESULT_JOINER.join(_format_single_result(result) for result in results)
+
+    return f"{header}{_RESULT_JOINER}{body}\n{_RESULT_SEPARATOR}"
 
 
 def _format_header(search_params: dict[str, Any], total_found: int) -> str:
@@ -55,22 +58,22 @@ def _format_header(search_params: dict[str, Any], total_found: int) -> str:
     limit = search_params.get("limit")
     limit_str = str(limit) if limit is not None else "None"
     
-    header_parts = [
-        f"Applications: {apps_str}",
+    header_parts = [f"Applications: {apps_str}"]
+
+    updated_date_type = search_params.get("updated_date_type")
+    if updated_date_type:
+        header_parts.append(_format_date_filter(updated_date_type, search_params))
+
+    parent_href = search_params.get("parent_href")
+    if parent_href:
+        header_parts.append(f"Parent: {parent_href}")
+
+    header_parts.extend((
         f"Sort: {sort}",
         f"Limit: {limit_str}",
         f"Total Results Found: {total_found}",
-    ]
-    
-    parent_href = search_params.get("parent_href")
-    if parent_href:
-        header_parts.insert(1, f"Parent: {parent_href}")
-    
-    updated_date_type = search_params.get("updated_date_type")
-    if updated_date_type:
-        date_filter = _format_date_filter(updated_date_type, search_params)
-        header_parts.insert(1, date_filter)
-    
+    ))
+
     header = f"Search Results for Query: {query_str} ({' | '.join(header_parts)}):"
     
     return header
@@ -141,13 +144,19 @@ def _format_date(date_str: str) -> str:
     Returns:
         Date in YYYY-MM-DD format, or the original string if parsing fails
     """
+    # Non-string values (e.g. epoch timestamps) can't be ISO dates
+    if not isinstance(date_str, str):
+        return str(date_str)
+
+    # ISO 8601 strings always start with the date, so slice it out directly
+    if len(date_str) >= 10 and date_str[4] == "-" and date_str[7] == "-":
+        return date_str[:10]
+
     try:
-        dt = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+        dt = datetime.fromisoformat(date_str)
         return dt.strftime(r"%Y-%m-%d")
-    except (ValueError, AttributeError):
-        if isinstance(date_str, str) and len(date_str) >= 10 and date_str[4] == "-" and date_str[7] == "-":
-            return date_str[:10]
-        return str(date_str)
+    except ValueError:
+        return date_str
 
 
 def _truncate_text(text: str, max_length: int = 200) -> str:
@@ -164,8 +173,11 @@ def _truncate_text(text: str, max_length: int = 200) -> str:
     if len(text) <= max_length:
         return text
     
-    truncated = text[:max_length].rsplit(" ", 1)[0]
-    return f"{truncated}..."
+    cut = text.rfind(" ", 0, max_length)
+    if cut <= 0:
+        cut = max_length
+
+    return f"{text[:cut]}..."
 
 
 def format_fetch_result(
@@ -212,23 +224,22 @@ def format_fetch_results(results: list[dict[str, str]], total_count: int) -> str
     if not results:
         return "No pages to display."
 
-    formatted_parts = []
-    
+    # One line per list item; the trailing "" keeps a blank line between pages
+    lines: list[str] = []
+
     for i, result in enumerate(results, start=1):
-        url = result.get("url", "Unknown URL")
-        markdown = result.get("markdown", "")
         error = result.get("error")
-        
-        header = f"===== PAGE {i} of {total_count} =====\nURL: {url}\n"
-        
-        if error:
-            content = f"\n[Error fetching page: {error}]\n"
-        else:
-            content = f"\n{markdown}\n"
-        
-        formatted_parts.append(header + content)
-    
-    return "\n".join(formatted_parts)
+        body = f"[Error fetching page: {error}]" if error else result.get("markdown", "")
+
+        lines.extend((
+            f"===== PAGE {i} of {total_count} =====",
+            f"URL: {result.get('url', 'Unknown URL')}",
+            "",
+            body,
+            "",
+        ))
+
+    return "\n".join(lines)
 
 
 def format_truncation_metadata(metadata: "TruncationMetadata", url: str) -> str:
@@ -241,13 +252,10 @@ def format_truncation_metadata(metadata: "TruncationMetadata", url: str) -> str:
     - Clear action instructions for continuation
     """
     # Calculate percentage with divide-by-zero protection
-    pct = int(100 * metadata.chars_returned / metadata.chars_total) if metadata.chars_total > 0 else 0
+    pct = (100 * metadata.chars_returned) // metadata.chars_total if metadata.chars_total > 0 else 0
     
     lines = [
-        "",
-        "---",
-        "",
-        "⚠️ CONTENT TRUNCATED",
+        *_TRUNCATION_BANNER,
         f"Showing {metadata.chars_returned:,} of {metadata.chars_total:,} chars ({pct}% of document)",
     ]
     
@@ -261,7 +269,7 @@ def format_truncation_metadata(metadata: "TruncationMetadata", url: str) -> str:
     if metadata.next_start_index is not None:
         lines.extend([
             "",
-            "To continue reading, call fetch with start_index:",
+            _CONTINUATION_HINT,
             f'  fetch(url="{url}", start_index={metadata.next_start_index})',
         ])
     
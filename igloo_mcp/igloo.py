@@ -4,9 +4,32 @@ from enum import Enum
 from typing import Any, Literal
 
 import httpx
+import orjson
 
+from igloo_mcp.logger import logger
+
+
+# Keep connections to the community alive between tool calls so repeated
+# requests skip the TCP/TLS handshake. With HTTP/2 negotiated, concurrent
+# pagination requests are multiplexed over a single connection.
+HTTP_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0,
+)
+
+AUTH_ENDPOINT = "/.api/api.svc/session/create"
+
+
+def _parse_json(response: httpx.Response) -> Any:
+    """Decode a JSON response body with orjson instead of httpx's stdlib-based `response.json()`."""
+    return orjson.loads(response.content)
+
+
+def _format_api_date(d: date) -> str:
+    """Format a date as MM-DD-YYYY, the format the Igloo search API expects."""
+    return f"{d.month:02d}-{d.day:02d}-{d.year:04d}"
 
-API_DATE_FORMAT = r"%m-%d-%Y"
 
 class ApplicationType(Enum):
     BLOG = 1
@@ -21,6 +44,10 @@ class ApplicationType(Enum):
     MICROBLOG = 10
 
 
+# API query string value for each application, built once at import
+_APPLICATION_PARAM_VALUES = {app: str(app.value) for app in ApplicationType}
+
+
 class UpdatedDateType(Enum):
     PAST_HOUR = "pastHour"
     PAST_24_HOURS = "pastTwentyFourHours"
@@ -42,6 +69,8 @@ class IglooClient:
         proxy: str | None = None,
         verify_ssl: bool = True,
         page_size: int = 50,
+        max_concurrent_requests: int = 8,
+        timeout: float = 15.0,
     ):
         """
         Initialize the Igloo client.
@@ -56,14 +85,20 @@ class IglooClient:
             proxy (str, optional): The proxy URL to use for requests. Defaults to None.
             verify_ssl (bool, optional): Whether to verify SSL certificates. Defaults to True.
             page_size (int): The number of results to fetch per page for paginated results. Defaults to 50.
+            max_concurrent_requests (int): The maximum number of API requests in flight at once,
+                e.g. while fetching search pages in parallel. Defaults to 8.
+            timeout (float): Seconds to wait for a response from Igloo before timing out,
+                for both API requests and page fetches. Defaults to 15.0.
         """
         self.community = community.rstrip("/")
+        self._community_prefixes = (f"{self.community}/", f"{self.community}?")
         self.app_id = app_id
         self.app_pass = app_pass
         self.community_key = community_key
         self.username = username
         self.password = password
         self.page_size = page_size
+        self.max_concurrent_requests = max_concurrent_requests
 
         self._client = httpx.AsyncClient(
             headers={
@@ -71,7 +106,13 @@ class IglooClient:
             },
             proxy=proxy,
             verify=verify_ssl,
+            http2=True,
+            limits=HTTP_LIMITS,
+            timeout=httpx.Timeout(connect=5.0, read=timeout, write=10.0, pool=5.0),
         )
+        self._session_key: str | None = None
+        self._auth_lock = asyncio.Lock()
+        self._request_semaphore = asyncio.Semaphore(max_concurrent_requests)
 
     async def _request(
         self, method: Literal["GET", "POST", "PUT", "DELETE"], endpoint: str, **kwargs
@@ -81,27 +122,62 @@ class IglooClient:
 
         Args:
             method: The HTTP method to use.
-            endpoint: The endpoint to request. Must start with a slash (/).
+            endpoint: The endpoint to request, relative to the community URL.
+                Must start with a slash (/) or a query string (?), or be empty.
             **kwargs: Additional arguments to pass to the request.
+
+        Notes:
+            - If the session has expired (HTTP 401), the client re-authenticates once
+              and retries the request before raising.
         """
-        if method not in {"GET", "POST", "PUT", "DELETE"}:
-            raise ValueError(f"Invalid HTTP method: {method}")
+        session_key = self._session_key
 
-        response = await self._client.request(
-            method=method,
-            url=self.community + endpoint,
-            **kwargs,
-        )
+        response = await self._send(method, endpoint, **kwargs)
+
+        if response.status_code == httpx.codes.UNAUTHORIZED and endpoint != AUTH_ENDPOINT:
+            await self._refresh_session(expired_session_key=session_key)
+            response = await self._send(method, endpoint, **kwargs)
 
         return response.raise_for_status()
 
+    async def _send(self, method: str, endpoint: str, **kwargs) -> httpx.Response:
+        """
+        Send a single API request, waiting for a free slot if too many are in flight.
+
+        The slot is released before `_request` re-authenticates, so a session refresh
+        never waits on requests that are themselves waiting for it.
+        """
+        async with self._request_semaphore:
+            return await self._client.request(
+                method=method,
+                url=self.community + endpoint,
+                **kwargs,
+            )
+
+    async def _refresh_session(self, expired_session_key: str | None) -> None:
+        """
+        Re-authenticate after the server rejected a session key.
+
+        Concurrent requests that fail with the same expired key share a single
+        re-authentication instead of each creating a new session.
+
+        Args:
+            expired_session_key: The session key that was sent with the rejected request.
+        """
+        async with self._auth_lock:
+            if self._session_key != expired_session_key:
+                return
+
+            logger.info("Igloo session was rejected, re-authenticating.")
+            await self.authenticate()
+
     async def authenticate(self) -> None:
         """
         Authenticate with the Igloo API to obtain a session key and set it as a cookie.
         """
         response = await self._request(
             method="POST",
-            endpoint="/.api/api.svc/session/create",
+            endpoint=AUTH_ENDPOINT,
             params={
                 "appId": self.app_id,
                 "appPass": self.app_pass,
@@ -112,10 +188,11 @@ class IglooClient:
             },
         )
 
-        response_data: dict[str, Any] = response.json()
+        response_data: dict[str, Any] = _parse_json(response)
 
         if api_key := (response_data.get("response") or {}).get("sessionKey"):
             self._client.cookies.set("iglooAuth", api_key)
+            self._session_key = api_key
 
         else:
             raise ValueError(
@@ -165,13 +242,17 @@ class IglooClient:
         """
         page_size = pagination_page_size or self.page_size
 
+        # A limit smaller than a page fits in the first request, so ask for exactly that many
+        if limit and limit < page_size:
+            page_size = limit
+
         params: dict[str, Any] = {"limit": str(page_size)}
 
         if query:
             params["query"] = query
 
         if applications:
-            params["applications"] = ",".join(str(app.value) for app in applications)
+            params["applications"] = ",".join(_APPLICATION_PARAM_VALUES[app] for app in applications)
 
         if parent_href:
             params["parentHref"] = parent_href.rstrip("/")
@@ -190,8 +271,8 @@ class IglooClient:
                         "when 'updated_date_type' is 'CUSTOM_RANGE'."
                     )
 
-                params["updatedFrom"] = updated_date_range_from.strftime(API_DATE_FORMAT)
-                params["updatedTo"] = updated_date_range_to.strftime(API_DATE_FORMAT)
+                params["updatedFrom"] = _format_api_date(updated_date_range_from)
+                params["updatedTo"] = _format_api_date(updated_date_range_to)
 
         endpoint = (
             f"/.api2/api/v1/communities/{self.community_key}/search/contentDetailed"
@@ -202,7 +283,7 @@ class IglooClient:
             params=params,
         )
 
-        first_response_json = first_response.json()
+        first_response_json = _parse_json(first_response)
         results = first_response_json.get("results") or []
         total_results_found = first_response_json.get("numFound", len(results))
 
@@ -217,30 +298,45 @@ class IglooClient:
             if limit is not None else total_results_found
         )
 
-        tasks = []
-        for offset in range(len(results), results_to_fetch, page_size):
-            page_params = params.copy()
-            page_params["offset"] = str(offset)
-
-            task = self._request(
-                method="GET",
-                endpoint=endpoint,
-                params=page_params,
-            )
-            tasks.append(task)
+        tasks = [
+            self._fetch_search_page(endpoint, {**params, "offset": str(offset)})
+            for offset in range(len(results), results_to_fetch, page_size)
+        ]
 
         if tasks:
-            remaining_responses = await asyncio.gather(*tasks)
-
-            for response in remaining_responses:
-                response_json = response.json()
-                results.extend(response_json.get("results", []))
+            # Let every page settle before surfacing a failure, so no page request is left
+            # running unobserved. A failed page still fails the search: returning a silently
+            # incomplete result set would misreport what the search found.
+            pages = await asyncio.gather(*tasks, return_exceptions=True)
+            errors = [page for page in pages if isinstance(page, BaseException)]
+            if errors:
+                logger.warning(f"{len(errors)} of {len(pages)} search result pages failed")
+                raise errors[0]
+
+            for page_results in pages:
+                results.extend(page_results)
 
         if limit is not None:
             return results[:limit]
         
         return results
 
+    async def _fetch_search_page(
+        self, endpoint: str, params: dict[str, Any]
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch one page of search results and return only its result items.
+
+        Parsing inside the page task lets each response body be released as soon as
+        its page arrives, instead of holding every response until all pages are done.
+
+        Args:
+            endpoint: The search endpoint to request.
+            params: The query parameters for this page, including its offset.
+        """
+        response = await self._request(method="GET", endpoint=endpoint, params=params)
+        return _parse_json(response).get("results") or []
+
     def _validate_community_url(self, url: str) -> None:
         """
         Validate that a URL belongs to the configured community.
@@ -251,12 +347,7 @@ class IglooClient:
         Raises:
             ValueError: If the URL does not belong to the configured community.
         """
-        is_valid = (
-            url == self.community
-            or url.startswith(f"{self.community}/")
-            or url.startswith(f"{self.community}?")
-        )
-        if not is_valid:
+        if url != self.community and not url.startswith(self._community_prefixes):
             raise ValueError(
                 f"URL must belong to community '{self.community}'. Got: {url}"
             )
@@ -276,14 +367,17 @@ class IglooClient:
             ValueError: If the URL does not belong to the configured community.
             httpx.HTTPStatusError: If the HTTP request fails with an error status.
             httpx.TimeoutException: If the request times out.
+
+        Notes:
+            - Like API requests, an expired session (HTTP 401) is refreshed once and the
+              fetch retried before raising.
         """
         self._validate_community_url(url)
-        response = await self._client.request(
+        response = await self._request(
             method="GET",
-            url=url,
+            endpoint=url[len(self.community):],
             headers={"Accept": "text/html"},
         )
-        response.raise_for_status()
         return response.text
 
     async def fetch_pages(self, urls: list[str]) -> list[str | BaseException]:
@@ -301,7 +395,10 @@ class IglooClient:
             list[str | BaseException]: List of results in the same order as input URLs.
                 Each element is either the HTML content (str) or a BaseException if fetch failed.
                 Caller should use isinstance() to check for exceptions.
+                Duplicate URLs are fetched once and share the same result.
         """
-        tasks = [self.fetch_page(url) for url in urls]
+        unique_urls = list(dict.fromkeys(urls))
+        tasks = [self.fetch_page(url) for url in unique_urls]
         results = await asyncio.gather(*tasks, return_exceptions=True)
-        return list(results)
+        results_by_url = dict(zip(unique_urls, results))
+        return [results_by_url[url] for url in urls]
@@ -37,6 +37,23 @@ class AppContext:
 
 _config = Config()
 
+# Igloo API search result fields kept for the LLM, mapped to their output names
+SEARCH_RESULT_FIELDS: dict[str, str] = {
+    "id": "id",
+    "title": "title",
+    "applicationType": "type",
+    "href": "relative_url",
+    "content": "content",
+    "description": "description",
+    "modifiedDate": "modified_date",
+    "numberOfComments": "comments_count",
+    "numberOfViews": "views_count",
+    "numberOfLikes": "likes_count",
+    "isArchived": "is_archived",
+    "isRecommended": "is_recommended",
+    "labels": "labels",
+}
+
 
 @asynccontextmanager
 async def lifespan(mcp: FastMCP) -> AsyncIterator[AppContext]:
@@ -58,6 +75,8 @@ async def lifespan(mcp: FastMCP) -> AsyncIterator[AppContext]:
         proxy=_config.proxy,
         verify_ssl=_config.verify_ssl,
         page_size=_config.page_size,
+        max_concurrent_requests=_config.max_concurrent_requests,
+        timeout=_config.fetch_timeout,
     )
 
     try:
@@ -186,30 +205,15 @@ async def search_tool(
         limit=limit_for_search,
     )
 
-    fields_mapping = {
-        "id": "id",
-        "title": "title",
-        "applicationType": "type",
-        "href": "relative_url",
-        "content": "content",
-        "description": "description",
-        "modifiedDate": "modified_date",
-        "numberOfComments": "comments_count",
-        "numberOfViews": "views_count",
-        "numberOfLikes": "likes_count",
-        "isArchived": "is_archived",
-        "isRecommended": "is_recommended",
-        "labels": "labels",
-    }
-
+    community = config.community
     output_results = [
         {
             **{
-                fields_mapping[key]: value
+                SEARCH_RESULT_FIELDS[key]: value
                 for key, value in item.items()
-                if key in fields_mapping
+                if key in SEARCH_RESULT_FIELDS
             },
-            "full_url": f"{config.community}{item['href']}",
+            "full_url": f"{community}{item['href']}",
         }
         for item in raw_results
     ]
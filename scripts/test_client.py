@@ -4,6 +4,9 @@ import re
 from mcp.client.session import ClientSession
 from mcp.client.streamable_http import streamablehttp_client
 
+TOTAL_RESULTS_RE = re.compile(r"Total Results Found: (\d+)")
+URL_RE = re.compile(r"URL: (https?://\S+)")
+
 
 async def main():
     """
@@ -42,7 +45,7 @@ async def main():
 
             result_text = result.content[0].text
             
-            count_match = re.search(r'Total Results Found: (\d+)', result_text)
+            count_match = TOTAL_RESULTS_RE.search(result_text)
             if count_match:
                 total_results = count_match.group(1)
                 print(f"\n{total_results} results received.\n")
@@ -50,8 +53,7 @@ async def main():
             print(result_text)
 
             # Step 2: Extract URLs from search results
-            url_pattern = r'URL: (https?://[^\s]+)'
-            urls = re.findall(url_pattern, result_text)
+            urls = URL_RE.findall(result_text)
             
             if not urls:
                 print("\nNo URLs found in search results to fetch.")
@@ -1,24 +1,34 @@
 """Shared fixtures and helpers for test suite."""
 
 import json
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 import pytest
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_data_path() -> Path:
     """Returns path to mock data directory."""
     return Path(__file__).parent / "tests_data" / "mock_data"
 
 
-@pytest.fixture
-def sample_search_results(mock_data_path: Path) -> list[dict[str, Any]]:
-    """Load and transform sample search results from mock data file."""
+@pytest.fixture(scope="session")
+def sample_search_results(mock_data_path: Path) -> tuple[Mapping[str, Any], ...]:
+    """
+    Load and transform sample search results from mock data file.
+
+    Loaded once per session and returned read-only, so tests cannot leak
+    mutations into each other.
+    """
     with open(mock_data_path / "search_single_page.json", "r") as f:
         mock_data = json.load(f)
-    return transform_raw_search_results(mock_data["results"])
+    return tuple(
+        MappingProxyType(result)
+        for result in transform_raw_search_results(mock_data["results"])
+    )
 
 
 @pytest.fixture
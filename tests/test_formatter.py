@@ -1,8 +1,12 @@
 """Tests for the formatter module."""
 
 import pytest
+from collections.abc import Callable, Iterable, Mapping
+from types import MappingProxyType
 from typing import Any
 
+from hypothesis import given, strategies as st
+
 from igloo_mcp.converter import TruncationMetadata
 from igloo_mcp.formatter import (
     format_search_results,
@@ -19,9 +23,49 @@ from igloo_mcp.formatter import (
 
 # Note: mock_data_path and sample_search_results fixtures are defined in conftest.py
 
+# Line separating the header and each result in format_search_results output
+SEP = "----------"
+
+# Search params shared by tests that don't care about the header; read-only so
+# no test can change them for the others
+_DEFAULT_SEARCH_PARAMS = MappingProxyType({"query": "test", "sort": "default", "limit": 20})
+
+# Larger inputs shared by edge-case tests, built once at import
+_BIG_LABELS = {str(i): f"Label{i}" for i in range(1, 101)}
+_LONG_PARENT_HREF = "/projects/" + "a" * 500
+
+
+def _assert_all_in(haystack: str, needles: Iterable[str]) -> None:
+    """Assert every needle occurs in haystack, reporting all missing needles at once."""
+    missing = [needle for needle in needles if needle not in haystack]
+    assert not missing, f"Missing from output: {missing}"
+
 
-@pytest.fixture
-def sample_results(sample_search_results: list[dict[str, Any]]) -> list[dict[str, Any]]:
+def _assert_none_in(haystack: str, needles: Iterable[str]) -> None:
+    """Assert no needle occurs in haystack, reporting all unexpected needles at once."""
+    unexpected = [needle for needle in needles if needle in haystack]
+    assert not unexpected, f"Unexpected in output: {unexpected}"
+
+
+@pytest.fixture(scope="session")
+def make_result() -> Callable[..., dict[str, Any]]:
+    """Factory for a minimal formatted search result, with any fields overridden."""
+    def make(**overrides: Any) -> dict[str, Any]:
+        return {
+            "title": "Test",
+            "type": "blog",
+            "full_url": "https://example.com/test",
+            "views_count": 10,
+            "comments_count": 2,
+            "likes_count": 1,
+            **overrides,
+        }
+
+    return make
+
+
+@pytest.fixture(scope="session")
+def sample_results(sample_search_results: tuple[Mapping[str, Any], ...]) -> tuple[Mapping[str, Any], ...]:
     """Alias for sample_search_results for backward compatibility."""
     return sample_search_results
 
@@ -33,19 +77,19 @@ class TestFormatSearchResults:
         """Test formatting with no results."""
         result = format_search_results(
             results=[],
-            search_params={"query": "test", "sort": "default", "limit": 20},
+            search_params=_DEFAULT_SEARCH_PARAMS,
             total_found=0,
         )
         
         assert "Search Results for Query: \"test\"" in result
         assert "No results found." in result
 
-    def test_single_result(self, sample_results: list[dict]):
+    def test_single_result(self, sample_results: tuple[Mapping[str, Any], ...]):
         """Test formatting with a single result."""
         single_result = sample_results[0]
         result = format_search_results(
             results=[single_result],
-            search_params={"query": "test", "sort": "default", "limit": 20},
+            search_params=_DEFAULT_SEARCH_PARAMS,
             total_found=1,
         )
         
@@ -54,35 +98,35 @@ class TestFormatSearchResults:
         assert single_result["full_url"] in result
         assert "Last Modified: 2025-09-01" in result
         assert f"Views: {single_result['views_count']} | Comments: {single_result['comments_count']} | Likes: {single_result['likes_count']}" in result
-        assert result.count("----------") == 2  # Start and end separators
+        assert result.count(SEP) == 2  # Start and end separators
 
-    def test_multiple_results(self, sample_results: list[dict]):
+    def test_multiple_results(self, sample_results: tuple[Mapping[str, Any], ...]):
         """Test formatting with multiple results."""
         result = format_search_results(
             results=sample_results,
-            search_params={"query": "test", "sort": "default", "limit": 20},
+            search_params=_DEFAULT_SEARCH_PARAMS,
             total_found=len(sample_results),
         )
         
         for item in sample_results:
             assert item["title"] in result
         
-        assert result.count("----------") == len(sample_results) + 1
+        assert result.count(SEP) == len(sample_results) + 1
 
-    def test_result_with_description(self, sample_results: list[dict]):
+    def test_result_with_description(self, sample_results: tuple[Mapping[str, Any], ...]):
         """Test formatting result with description."""
         # Find a result with a description
         result_with_desc = next(item for item in sample_results if item.get("description"))
         
         result = format_search_results(
             results=[result_with_desc],
-            search_params={"query": "test", "sort": "default", "limit": 20},
+            search_params=_DEFAULT_SEARCH_PARAMS,
             total_found=1,
         )
         
         assert f"Description: {result_with_desc['description']}" in result
 
-    def test_result_with_content(self, sample_results: list[dict]):
+    def test_result_with_content(self, sample_results: tuple[Mapping[str, Any], ...]):
         """Test formatting result with content (no description)."""
         result_with_content = {
             "title": "Test With Content",
@@ -96,7 +140,7 @@ class TestFormatSearchResults:
         
         result = format_search_results(
             results=[result_with_content],
-            search_params={"query": "test", "sort": "default", "limit": 20},
+            search_params=_DEFAULT_SEARCH_PARAMS,
             total_found=1,
         )
         
@@ -117,7 +161,7 @@ class TestFormatSearchResults:
         
         result = format_search_results(
             results=results,
-            search_params={"query": "test", "sort": "default", "limit": 20},
+            search_params=_DEFAULT_SEARCH_PARAMS,
             total_found=1,
         )
         
@@ -138,7 +182,7 @@ class TestFormatSearchResults:
         
         result = format_search_results(
             results=results,
-            search_params={"query": "test", "sort": "default", "limit": 20},
+            search_params=_DEFAULT_SEARCH_PARAMS,
             total_found=1,
         )
         
@@ -158,7 +202,7 @@ class TestFormatSearchResults:
         
         result = format_search_results(
             results=results,
-            search_params={"query": "test", "sort": "default", "limit": 20},
+            search_params=_DEFAULT_SEARCH_PARAMS,
             total_found=1,
         )
         
@@ -178,13 +222,13 @@ class TestFormatSearchResults:
         
         result = format_search_results(
             results=results,
-            search_params={"query": "test", "sort": "default", "limit": 20},
+            search_params=_DEFAULT_SEARCH_PARAMS,
             total_found=1,
         )
         
         assert "* This item is archived" in result
 
-    def test_result_not_recommended_not_shown(self, sample_results: list[dict]):
+    def test_result_not_recommended_not_shown(self, sample_results: tuple[Mapping[str, Any], ...]):
         """Test that non-recommended items don't show the annotation."""
         result_not_recommended = next(
             item for item in sample_results if not item.get("is_recommended")
@@ -192,199 +236,133 @@ class TestFormatSearchResults:
         
         result = format_search_results(
             results=[result_not_recommended],
-            search_params={"query": "test", "sort": "default", "limit": 20},
+            search_params=_DEFAULT_SEARCH_PARAMS,
             total_found=1,
         )
         
         assert "* This item is recommended" not in result
 
 
+# (search_params, total_found, substrings expected in the header)
+HEADER_CASES = [
+    pytest.param(
+        _DEFAULT_SEARCH_PARAMS,
+        5,
+        [
+            'Search Results for Query: "test"',
+            "Applications: All",
+            "Sort: default",
+            "Limit: 20",
+            "Total Results Found: 5",
+        ],
+        id="basic",
+    ),
+    pytest.param(
+        {"sort": "default", "limit": 20},
+        5,
+        ["Search Results for Query: All"],
+        id="no_query",
+    ),
+    pytest.param(
+        {**_DEFAULT_SEARCH_PARAMS, "applications": ["blog", "pages"]},
+        5,
+        ["Applications: blog, pages"],
+        id="applications",
+    ),
+    pytest.param(
+        {**_DEFAULT_SEARCH_PARAMS, "parent_href": "/projects/ai"},
+        5,
+        ["Parent: /projects/ai"],
+        id="parent",
+    ),
+    pytest.param(
+        {**_DEFAULT_SEARCH_PARAMS, "updated_date_type": "past_month"},
+        5,
+        ["Date Filter: Past Month"],
+        id="date_filter",
+    ),
+    pytest.param(
+        {
+            **_DEFAULT_SEARCH_PARAMS,
+            "updated_date_type": "custom_range",
+            "updated_date_range_from": "2025-01-01",
+            "updated_date_range_to": "2025-01-31",
+        },
+        5,
+        ["Date Filter: 2025-01-01 to 2025-01-31"],
+        id="custom_date_range",
+    ),
+    pytest.param(
+        {"query": "test", "sort": "views", "limit": 20},
+        5,
+        ["Sort: views"],
+        id="views_sort",
+    ),
+    pytest.param(
+        {"query": "test", "sort": "default"},
+        5,
+        ["Limit: None"],
+        id="no_limit",
+    ),
+    pytest.param(
+        {**_DEFAULT_SEARCH_PARAMS, "applications": []},
+        5,
+        ["Applications: All"],
+        id="empty_applications_list",
+    ),
+    pytest.param(
+        {**_DEFAULT_SEARCH_PARAMS, "parent_href": _LONG_PARENT_HREF},
+        5,
+        [f"Parent: {_LONG_PARENT_HREF}"],
+        id="very_long_parent_href",
+    ),
+    pytest.param(
+        {
+            "query": "test",
+            "applications": ["blog", "pages", "documents"],
+            "parent_href": "/projects/ai/ml",
+            "updated_date_type": "past_week",
+            "sort": "views",
+            "limit": 50,
+        },
+        42,
+        [
+            'Search Results for Query: "test"',
+            "Applications: blog, pages, documents",
+            "Parent: /projects/ai/ml",
+            "Date Filter: Past Week",
+            "Sort: views",
+            "Limit: 50",
+            "Total Results Found: 42",
+        ],
+        id="all_optional_parameters",
+    ),
+    pytest.param(
+        {"query": "test", "sort": "default", "limit": 0},
+        5,
+        ["Limit: 0"],
+        id="limit_zero",
+    ),
+]
+
+
 class TestFormatHeader:
     """Tests for header formatting."""
 
-    def test_basic_header(self):
-        """Test basic header with minimal parameters."""
-        header = _format_header(
-            search_params={"query": "test", "sort": "default", "limit": 20},
-            total_found=5,
-        )
-        
-        assert 'Search Results for Query: "test"' in header
-        assert "Applications: All" in header
-        assert "Sort: default" in header
-        assert "Limit: 20" in header
-        assert "Total Results Found: 5" in header
-
-    def test_header_no_query(self):
-        """Test header with no query."""
-        header = _format_header(
-            search_params={"sort": "default", "limit": 20},
-            total_found=5,
-        )
-        
-        assert "Search Results for Query: All" in header
-
-    def test_header_with_applications(self):
-        """Test header with application filters."""
-        header = _format_header(
-            search_params={
-                "query": "test",
-                "applications": ["blog", "pages"],
-                "sort": "default",
-                "limit": 20,
-            },
-            total_found=5,
-        )
-        
-        assert "Applications: blog, pages" in header
-
-    def test_header_with_parent(self):
-        """Test header with parent href."""
-        header = _format_header(
-            search_params={
-                "query": "test",
-                "parent_href": "/projects/ai",
-                "sort": "default",
-                "limit": 20,
-            },
-            total_found=5,
-        )
-        
-        assert "Parent: /projects/ai" in header
-
-    def test_header_with_date_filter(self):
-        """Test header with date filter."""
-        header = _format_header(
-            search_params={
-                "query": "test",
-                "updated_date_type": "past_month",
-                "sort": "default",
-                "limit": 20,
-            },
-            total_found=5,
-        )
-        
-        assert "Date Filter: Past Month" in header
-
-    def test_header_with_custom_date_range(self):
-        """Test header with custom date range."""
-        header = _format_header(
-            search_params={
-                "query": "test",
-                "updated_date_type": "custom_range",
-                "updated_date_range_from": "2025-01-01",
-                "updated_date_range_to": "2025-01-31",
-                "sort": "default",
-                "limit": 20,
-            },
-            total_found=5,
-        )
-        
-        assert "Date Filter: 2025-01-01 to 2025-01-31" in header
-
-    def test_header_with_views_sort(self):
-        """Test header with views sorting."""
-        header = _format_header(
-            search_params={
-                "query": "test",
-                "sort": "views",
-                "limit": 20,
-            },
-            total_found=5,
-        )
-        
-        assert "Sort: views" in header
-
-    def test_header_no_limit(self):
-        """Test header with no limit."""
-        header = _format_header(
-            search_params={
-                "query": "test",
-                "sort": "default",
-            },
-            total_found=5,
-        )
-        
-        assert "Limit: None" in header
-
-    def test_header_with_empty_applications_list(self):
-        """Test header with empty applications list displays 'All'."""
-        header = _format_header(
-            search_params={
-                "query": "test",
-                "applications": [],
-                "sort": "default",
-                "limit": 20,
-            },
-            total_found=5,
-        )
-        
-        assert "Applications: All" in header
-
-    def test_header_with_very_long_parent_href(self):
-        """Test header with very long parent href (500+ characters)."""
-        long_parent_href = "/projects/" + "a" * 500
-        header = _format_header(
-            search_params={
-                "query": "test",
-                "parent_href": long_parent_href,
-                "sort": "default",
-                "limit": 20,
-            },
-            total_found=5,
-        )
-        
-        assert f"Parent: {long_parent_href}" in header
-
-    def test_header_with_all_optional_parameters(self):
-        """Test header with all optional parameters present simultaneously."""
-        header = _format_header(
-            search_params={
-                "query": "test",
-                "applications": ["blog", "pages", "documents"],
-                "parent_href": "/projects/ai/ml",
-                "updated_date_type": "past_week",
-                "sort": "views",
-                "limit": 50,
-            },
-            total_found=42,
-        )
-        
-        assert 'Search Results for Query: "test"' in header
-        assert "Applications: blog, pages, documents" in header
-        assert "Parent: /projects/ai/ml" in header
-        assert "Date Filter: Past Week" in header
-        assert "Sort: views" in header
-        assert "Limit: 50" in header
-        assert "Total Results Found: 42" in header
-
-    def test_header_with_limit_zero(self):
-        """Test header with limit explicitly set to 0."""
-        header = _format_header(
-            search_params={
-                "query": "test",
-                "sort": "default",
-                "limit": 0,
-            },
-            total_found=5,
-        )
-        
-        assert "Limit: 0" in header
+    @pytest.mark.parametrize("search_params,total_found,expected", HEADER_CASES)
+    def test_header(self, search_params: Mapping[str, Any], total_found: int, expected: list[str]):
+        """Test the header contains every expected part for each parameter combination."""
+        header = _format_header(search_params=search_params, total_found=total_found)
+
+        _assert_all_in(header, expected)
 
 
 class TestFormatSingleResult:
     """Tests for formatting individual results."""
 
-    def test_minimal_result(self):
+    def test_minimal_result(self, make_result: Callable[..., dict[str, Any]]):
         """Test formatting a minimal result with only required fields."""
-        result = _format_single_result({
-            "title": "Test",
-            "type": "blog",
-            "full_url": "https://example.com/test",
-            "views_count": 10,
-            "comments_count": 2,
-            "likes_count": 1,
-        })
+        result = _format_single_result(make_result())
         
         assert "Title: Test" in result
         assert "Type: blog" in result
@@ -413,88 +391,39 @@ class TestFormatSingleResult:
         
         assert "Views: 0 | Comments: 0 | Likes: 0" in result
 
-    def test_result_with_empty_labels_dict(self):
+    def test_result_with_empty_labels_dict(self, make_result: Callable[..., dict[str, Any]]):
         """Test that empty labels dict doesn't show labels line."""
-        result = _format_single_result({
-            "title": "Test",
-            "type": "blog",
-            "full_url": "https://example.com/test",
-            "labels": {},
-            "views_count": 10,
-            "comments_count": 2,
-            "likes_count": 1,
-        })
+        result = _format_single_result(make_result(labels={}))
         
         assert "Labels:" not in result
 
-    def test_result_with_none_description(self):
+    def test_result_with_none_description(self, make_result: Callable[..., dict[str, Any]]):
         """Test formatting result with None description value."""
-        result = _format_single_result({
-            "title": "Test",
-            "type": "blog",
-            "full_url": "https://example.com/test",
-            "description": None,
-            "views_count": 10,
-            "comments_count": 2,
-            "likes_count": 1,
-        })
+        result = _format_single_result(make_result(description=None))
         
         assert "Description:" not in result
 
-    def test_result_with_none_content(self):
+    def test_result_with_none_content(self, make_result: Callable[..., dict[str, Any]]):
         """Test formatting result with None content value."""
-        result = _format_single_result({
-            "title": "Test",
-            "type": "blog",
-            "full_url": "https://example.com/test",
-            "content": None,
-            "views_count": 10,
-            "comments_count": 2,
-            "likes_count": 1,
-        })
+        result = _format_single_result(make_result(content=None))
         
         assert "Content:" not in result
 
-    def test_result_with_none_modified_date(self):
+    def test_result_with_none_modified_date(self, make_result: Callable[..., dict[str, Any]]):
         """Test formatting result with None modified_date value."""
-        result = _format_single_result({
-            "title": "Test",
-            "type": "blog",
-            "full_url": "https://example.com/test",
-            "modified_date": None,
-            "views_count": 10,
-            "comments_count": 2,
-            "likes_count": 1,
-        })
+        result = _format_single_result(make_result(modified_date=None))
         
         assert "Last Modified:" not in result
 
-    def test_result_with_none_labels(self):
+    def test_result_with_none_labels(self, make_result: Callable[..., dict[str, Any]]):
         """Test formatting result with None labels value."""
-        result = _format_single_result({
-            "title": "Test",
-            "type": "blog",
-            "full_url": "https://example.com/test",
-            "labels": None,
-            "views_count": 10,
-            "comments_count": 2,
-            "likes_count": 1,
-        })
+        result = _format_single_result(make_result(labels=None))
         
         assert "Labels:" not in result
 
-    def test_result_with_very_long_labels_list(self):
+    def test_result_with_very_long_labels_list(self, make_result: Callable[..., dict[str, Any]]):
         """Test formatting result with very long labels list (100+ items)."""
-        labels_dict = {str(i): f"Label{i}" for i in range(1, 101)}
-        result = _format_single_result({
-            "title": "Test",
-            "type": "blog",
-            "full_url": "https://example.com/test",
-            "labels": labels_dict,
-            "views_count": 10,
-            "comments_count": 2,
-            "likes_count": 1,
-        })
+        result = _format_single_result(make_result(labels=_BIG_LABELS))
         
         assert "Labels:" in result
         # Verify it contains multiple labels
@@ -502,127 +431,73 @@ class TestFormatSingleResult:
         assert "Label50" in result
         assert "Label100" in result
 
-    def test_result_with_numeric_only_labels(self):
+    def test_result_with_numeric_only_labels(self, make_result: Callable[..., dict[str, Any]]):
         """Test formatting result with labels having only numeric values."""
-        result = _format_single_result({
-            "title": "Test",
-            "type": "blog",
-            "full_url": "https://example.com/test",
-            "labels": {"1": 123, "2": 456, "3": 789},
-            "views_count": 10,
-            "comments_count": 2,
-            "likes_count": 1,
-        })
+        result = _format_single_result(make_result(labels={"1": 123, "2": 456, "3": 789}))
         
         assert "Labels:" in result
         assert "123" in result
         assert "456" in result
         assert "789" in result
 
-    def test_result_both_recommended_and_archived(self):
+    def test_result_both_recommended_and_archived(self, make_result: Callable[..., dict[str, Any]]):
         """Test formatting result with both is_recommended and is_archived set to True."""
-        result = _format_single_result({
-            "title": "Test",
-            "type": "blog",
-            "full_url": "https://example.com/test",
-            "is_recommended": True,
-            "is_archived": True,
-            "views_count": 10,
-            "comments_count": 2,
-            "likes_count": 1,
-        })
+        result = _format_single_result(make_result(is_recommended=True, is_archived=True))
         
         assert "* This item is recommended" in result
         assert "* This item is archived" in result
 
-    def test_result_missing_modified_date_field(self):
+    def test_result_missing_modified_date_field(self, make_result: Callable[..., dict[str, Any]]):
         """Test formatting result without modified_date field entirely."""
-        result = _format_single_result({
-            "title": "Test",
-            "type": "blog",
-            "full_url": "https://example.com/test",
-            "views_count": 10,
-            "comments_count": 2,
-            "likes_count": 1,
-        })
+        result = _format_single_result(make_result())
         
         assert "Last Modified:" not in result
 
-    def test_result_empty_string_vs_none_description(self):
+    def test_result_empty_string_vs_none_description(self, make_result: Callable[..., dict[str, Any]]):
         """Test distinction between empty string and None for description."""
-        result_empty = _format_single_result({
-            "title": "Test",
-            "type": "blog",
-            "full_url": "https://example.com/test",
-            "description": "",
-            "views_count": 10,
-            "comments_count": 2,
-            "likes_count": 1,
-        })
+        result_empty = _format_single_result(make_result(description=""))
         
         assert "Description:" not in result_empty
 
-    def test_result_empty_string_vs_none_content(self):
+    def test_result_empty_string_vs_none_content(self, make_result: Callable[..., dict[str, Any]]):
         """Test distinction between empty string and None for content."""
-        result_empty = _format_single_result({
-            "title": "Test",
-            "type": "blog",
-            "full_url": "https://example.com/test",
-            "content": "",
-            "views_count": 10,
-            "comments_count": 2,
-            "likes_count": 1,
-        })
+        result_empty = _format_single_result(make_result(content=""))
         
         assert "Content:" not in result_empty
 
-    def test_result_url_with_special_characters(self):
+    def test_result_url_with_special_characters(self, make_result: Callable[..., dict[str, Any]]):
         """Test formatting result with URL containing special characters."""
         special_url = "https://example.com/test?param=value&foo=bar#section"
-        result = _format_single_result({
-            "title": "Test",
-            "type": "blog",
-            "full_url": special_url,
-            "views_count": 10,
-            "comments_count": 2,
-            "likes_count": 1,
-        })
+        result = _format_single_result(make_result(full_url=special_url))
         
         assert f"URL: {special_url}" in result
 
 
-class TestFormatDate:
-    """Tests for date formatting."""
-
-    def test_iso_datetime_with_timezone(self):
-        """Test parsing ISO datetime with timezone."""
-        formatted = _format_date("2025-11-06T14:20:28.85-05:00")
-        assert formatted == "2025-11-06"
-
-    def test_iso_datetime_utc(self):
-        """Test parsing ISO datetime in UTC."""
-        formatted = _format_date("2025-11-06T14:20:28Z")
-        assert formatted == "2025-11-06"
+# (input, expected) pairs for _format_date
+DATE_CASES = [
+    ("2025-11-06T14:20:28.85-05:00", "2025-11-06"),  # ISO datetime with timezone
+    ("2025-11-06T14:20:28Z", "2025-11-06"),  # ISO datetime in UTC
+    ("2025-11-06", "2025-11-06"),  # Simple date
+    ("invalid-date", "invalid-date"),  # Invalid date is returned unchanged
+    ("short", "short"),  # Short string that can't be a date
+    ("2025-11-06T14:20:28.123456Z", "2025-11-06"),  # ISO datetime with microseconds
+    ("2024-02-29T12:00:00Z", "2024-02-29"),  # Leap year date
+    ("2025-13-01T12:00:00Z", "2025-13-01"),  # Invalid month keeps the date prefix
+    ("", ""),  # Empty string
+    (1730900000000, "1730900000000"),  # Epoch timestamp int is returned as a string
+    (1730900000.5, "1730900000.5"),  # Non-string float is returned as a string
+    (None, "None"),  # None is returned as a string
+]
 
-    def test_simple_date(self):
-        """Test simple date string."""
-        formatted = _format_date("2025-11-06")
-        assert formatted == "2025-11-06"
 
-    def test_invalid_date(self):
-        """Test handling of invalid date."""
-        formatted = _format_date("invalid-date")
-        assert formatted == "invalid-date"
-
-    def test_short_string(self):
-        """Test handling of short string that can't be a date."""
-        formatted = _format_date("short")
-        assert formatted == "short"
+class TestFormatDate:
+    """Tests for date formatting."""
 
-    def test_iso_datetime_with_microseconds(self):
-        """Test parsing ISO datetime with microseconds."""
-        formatted = _format_date("2025-11-06T14:20:28.123456Z")
-        assert formatted == "2025-11-06"
+    @pytest.mark.parametrize("date_input,expected", DATE_CASES)
+    def test_format_date(self, date_input: Any, expected: str):
+        """Test formatting of ISO dates and fallback for unparseable input."""
+        formatted = _format_date(date_input)
+        assert formatted == expected
 
     @pytest.mark.parametrize("date_input,expected", [
         ("2025-11-06T14:20:28+05:30", "2025-11-06"),  # Timezone +0530
@@ -643,39 +518,30 @@ class TestFormatDate:
         formatted = _format_date(date_input)
         assert formatted == expected
 
-    def test_leap_year_date(self):
-        """Test parsing leap year date (Feb 29, 2024)."""
-        formatted = _format_date("2024-02-29T12:00:00Z")
-        assert formatted == "2024-02-29"
-
-    def test_invalid_month(self):
-        """Test handling of invalid month (13) - extracts first 10 chars as fallback."""
-        formatted = _format_date("2025-13-01T12:00:00Z")
-        assert formatted == "2025-13-01"
-
-    def test_empty_string_input(self):
-        """Test handling of empty string input."""
-        formatted = _format_date("")
-        assert formatted == ""
-
-
 
 class TestTruncateText:
     """Tests for text truncation."""
 
+    @given(text=st.text(max_size=500), max_length=st.integers(min_value=1, max_value=500))
+    def test_truncation_invariants(self, text: str, max_length: int):
+        """Test truncation invariants hold for arbitrary text and limits."""
+        truncated = _truncate_text(text, max_length=max_length)
+
+        if len(text) <= max_length:
+            assert truncated == text
+        else:
+            assert truncated.endswith("...")
+            assert len(truncated) <= max_length + 3
+            kept = truncated[:-3]
+            assert kept
+            assert text.startswith(kept)
+
     def test_short_text_not_truncated(self):
         """Test that short text is not truncated."""
         text = "This is a short text"
         truncated = _truncate_text(text, max_length=200)
         assert truncated == text
 
-    def test_long_text_truncated(self):
-        """Test that long text is truncated."""
-        text = "a" * 250
-        truncated = _truncate_text(text, max_length=200)
-        assert len(truncated) <= 203  # 200 + "..."
-        assert truncated.endswith("...")
-
     def test_truncation_at_word_boundary(self):
         """Test that truncation happens at word boundaries."""
         text = "This is a very long text " * 20
@@ -698,26 +564,11 @@ class TestTruncateText:
         assert len(truncated) == 200
         assert not truncated.endswith("...")
 
-    def test_text_with_only_spaces(self):
-        """Test text containing only spaces."""
-        text = " " * 250
-        truncated = _truncate_text(text, max_length=200)
-        assert len(truncated) <= 203
-
-    def test_text_with_no_spaces(self):
-        """Test text with no spaces (single long word)."""
-        text = "a" * 250
-        truncated = _truncate_text(text, max_length=200)
-        assert len(truncated) <= 203
-        assert truncated.endswith("...")
-
-    def test_unicode_emoji_characters(self):
-        """Test text with unicode/emoji characters."""
-        text = "Hello 👋 World " * 30
+    def test_text_with_only_leading_space(self):
+        """Test that a lone leading space does not truncate the text to nothing."""
+        text = " " + "a" * 250
         truncated = _truncate_text(text, max_length=200)
-        assert len(truncated) <= 203
-        if len(text) > 200:
-            assert truncated.endswith("...")
+        assert truncated == text[:200] + "..."
 
     def test_text_ending_with_multiple_spaces(self):
         """Test text ending with multiple spaces before truncation."""
@@ -783,6 +634,46 @@ class TestFormatDateFilter:
         assert result == "Date Filter: Unknown Filter Type"
 
 
+# (results, substrings expected in the output) for multi-page format_fetch_results
+MULTI_PAGE_FETCH_CASES = [
+    pytest.param(
+        (
+            {"url": "https://example.com/wiki/page1", "markdown": "# Page 1 Content"},
+            {"url": "https://example.com/wiki/page2", "markdown": "# Page 2 Content"},
+            {"url": "https://example.com/wiki/page3", "markdown": "# Page 3 Content"},
+        ),
+        (
+            "===== PAGE 1 of 3 =====",
+            "===== PAGE 2 of 3 =====",
+            "===== PAGE 3 of 3 =====",
+            "URL: https://example.com/wiki/page1",
+            "URL: https://example.com/wiki/page2",
+            "URL: https://example.com/wiki/page3",
+            "# Page 1 Content",
+            "# Page 2 Content",
+            "# Page 3 Content",
+        ),
+        id="all_success",
+    ),
+    pytest.param(
+        (
+            {"url": "https://example.com/wiki/page1", "markdown": "# Success Content"},
+            {"url": "https://example.com/wiki/failed", "error": "Request timed out"},
+            {"url": "https://example.com/wiki/page3", "markdown": "# Another Success"},
+        ),
+        (
+            "===== PAGE 1 of 3 =====",
+            "===== PAGE 2 of 3 =====",
+            "===== PAGE 3 of 3 =====",
+            "# Success Content",
+            "[Error fetching page: Request timed out]",
+            "# Another Success",
+        ),
+        id="mixed_success_and_errors",
+    ),
+]
+
+
 class TestFormatFetchResults:
     """Tests for the format_fetch_results function (multiple pages)."""
 
@@ -805,35 +696,6 @@ class TestFormatFetchResults:
         assert "# Page 1" in result
         assert "This is the content." in result
 
-    def test_multiple_pages_success(self):
-        """Test formatting multiple successful pages."""
-        results = [
-            {
-                "url": "https://example.com/wiki/page1",
-                "markdown": "# Page 1 Content",
-            },
-            {
-                "url": "https://example.com/wiki/page2",
-                "markdown": "# Page 2 Content",
-            },
-            {
-                "url": "https://example.com/wiki/page3",
-                "markdown": "# Page 3 Content",
-            },
-        ]
-        
-        result = format_fetch_results(results=results, total_count=3)
-        
-        assert "===== PAGE 1 of 3 =====" in result
-        assert "===== PAGE 2 of 3 =====" in result
-        assert "===== PAGE 3 of 3 =====" in result
-        assert "URL: https://example.com/wiki/page1" in result
-        assert "URL: https://example.com/wiki/page2" in result
-        assert "URL: https://example.com/wiki/page3" in result
-        assert "# Page 1 Content" in result
-        assert "# Page 2 Content" in result
-        assert "# Page 3 Content" in result
-
     def test_page_with_error(self):
         """Test formatting a page that has an error."""
         results = [{
@@ -847,31 +709,12 @@ class TestFormatFetchResults:
         assert "URL: https://example.com/wiki/failed-page" in result
         assert "[Error fetching page: HTTP 404 - Failed to fetch page]" in result
 
-    def test_mixed_success_and_errors(self):
-        """Test formatting mix of successful and failed pages."""
-        results = [
-            {
-                "url": "https://example.com/wiki/page1",
-                "markdown": "# Success Content",
-            },
-            {
-                "url": "https://example.com/wiki/failed",
-                "error": "Request timed out",
-            },
-            {
-                "url": "https://example.com/wiki/page3",
-                "markdown": "# Another Success",
-            },
-        ]
-        
-        result = format_fetch_results(results=results, total_count=3)
-        
-        assert "===== PAGE 1 of 3 =====" in result
-        assert "===== PAGE 2 of 3 =====" in result
-        assert "===== PAGE 3 of 3 =====" in result
-        assert "# Success Content" in result
-        assert "[Error fetching page: Request timed out]" in result
-        assert "# Another Success" in result
+    @pytest.mark.parametrize("results,expected", MULTI_PAGE_FETCH_CASES)
+    def test_multiple_pages(self, results: tuple[dict[str, str], ...], expected: tuple[str, ...]):
+        """Test formatting several pages, including a mix of successes and failures."""
+        result = format_fetch_results(results=list(results), total_count=len(results))
+
+        _assert_all_in(result, expected)
 
     def test_missing_url(self):
         """Test formatting result with missing URL field."""
@@ -952,137 +795,155 @@ class TestFormatFetchResults:
         assert "URL: https://example.com/wiki/page?param=value&foo=bar#section" in result
 
 
-class TestFormatTruncationMetadata:
-    """Tests for the format_truncation_metadata function."""
-
-    def test_basic_metadata(self):
-        """Test formatting with minimal metadata."""
-        metadata = TruncationMetadata(
-            status="partial",
-            chars_returned=1000,
-            chars_total=5000,
-            next_start_index=1000,
-        )
-        url = "https://example.com/wiki/page"
-        
-        result = format_truncation_metadata(metadata, url)
-        
-        assert "⚠️ CONTENT TRUNCATED" in result
-        assert "Showing 1,000 of 5,000 chars (20% of document)" in result
-        assert "To continue reading, call fetch with start_index:" in result
-        assert 'fetch(url="https://example.com/wiki/page", start_index=1000)' in result
-
-    def test_metadata_with_current_path(self):
-        """Test formatting with current section path."""
-        metadata = TruncationMetadata(
-            status="partial",
-            chars_returned=5000,
-            chars_total=20000,
-            next_start_index=5000,
-            current_path="Documentation > API Reference",
-        )
-        url = "https://example.com/docs"
-        
-        result = format_truncation_metadata(metadata, url)
-        
-        assert "Current section: Documentation > API Reference" in result
+# (TruncationMetadata kwargs, url, substrings expected, substrings that must be absent)
+TRUNCATION_CASES = [
+    pytest.param(
+        {"status": "partial", "chars_returned": 1000, "chars_total": 5000, "next_start_index": 1000},
+        "https://example.com/wiki/page",
+        (
+            "⚠️ CONTENT TRUNCATED",
+            "Showing 1,000 of 5,000 chars (20% of document)",
+            "To continue reading, call fetch with start_index:",
+            'fetch(url="https://example.com/wiki/page", start_index=1000)',
+        ),
+        (),
+        id="basic",
+    ),
+    pytest.param(
+        {
+            "status": "partial",
+            "chars_returned": 5000,
+            "chars_total": 20000,
+            "next_start_index": 5000,
+            "current_path": "Documentation > API Reference",
+        },
+        "https://example.com/docs",
+        ("Current section: Documentation > API Reference",),
+        (),
+        id="current_path",
+    ),
+    pytest.param(
+        {
+            "status": "partial",
+            "chars_returned": 10000,
+            "chars_total": 50000,
+            "next_start_index": 10000,
+            "remaining_sections": ["Rate Limits", "Error Codes", "Webhooks"],
+        },
+        "https://example.com/api-docs",
+        ("Upcoming sections: Rate Limits, Error Codes, Webhooks",),
+        (),
+        id="remaining_sections",
+    ),
+    pytest.param(
+        {
+            "status": "partial",
+            "chars_returned": 49800,
+            "chars_total": 125000,
+            "next_start_index": 49800,
+            "current_path": "Docs > API > Authentication",
+            "remaining_sections": ["Rate Limits", "Error Codes", "Webhooks", "Examples", "FAQ"],
+        },
+        "https://igloo.example.com/wiki/api-documentation",
+        (
+            "---",
+            "⚠️ CONTENT TRUNCATED",
+            "Showing 49,800 of 125,000 chars (39% of document)",
+            "Current section: Docs > API > Authentication",
+            "Upcoming sections: Rate Limits, Error Codes, Webhooks, Examples, FAQ",
+            "To continue reading, call fetch with start_index:",
+            'fetch(url="https://igloo.example.com/wiki/api-documentation", start_index=49800)',
+        ),
+        (),
+        id="full",
+    ),
+    pytest.param(
+        {"status": "partial", "chars_returned": 1000, "chars_total": 5000, "next_start_index": None},
+        "https://example.com/page",
+        ("⚠️ CONTENT TRUNCATED", "Showing 1,000 of 5,000 chars (20% of document)"),
+        ("To continue reading",),
+        id="no_next_index",
+    ),
+    pytest.param(
+        {
+            "status": "partial",
+            "chars_returned": 4500,
+            "chars_total": 5000,
+            "next_start_index": 4500,
+            "remaining_sections": [],
+        },
+        "https://example.com/page",
+        (),
+        ("Upcoming sections:",),
+        id="empty_remaining_sections",
+    ),
+    pytest.param(
+        {"status": "partial", "chars_returned": 1234567, "chars_total": 9876543, "next_start_index": 1234567},
+        "https://example.com/large-doc",
+        ("Showing 1,234,567 of 9,876,543 chars",),
+        (),
+        id="large_numbers_formatted",
+    ),
+    pytest.param(
+        {"status": "partial", "chars_returned": 1000, "chars_total": 5000, "next_start_index": 1000},
+        "https://example.com/page?query=test&filter=active",
+        (
+            "To continue reading, call fetch with start_index:",
+            '  fetch(url="https://example.com/page?query=test&filter=active", start_index=1000)',
+        ),
+        (),
+        id="url_with_special_characters",
+    ),
+    pytest.param(
+        {
+            "status": "partial",
+            "chars_returned": 1000,
+            "chars_total": 5000,
+            "next_start_index": 1000,
+            "current_path": "Section A",
+            "remaining_sections": ["Section B", "Section C"],
+        },
+        "https://example.com/page",
+        (
+            "To continue reading, call fetch with start_index:",
+            '  fetch(url="https://example.com/page", start_index=1000)',
+        ),
+        ("|",),  # Continuation is an indented command, not a table
+        id="continuation_indentation",
+    ),
+    pytest.param(
+        {"status": "partial", "chars_returned": 1000, "chars_total": 5000, "next_start_index": 1000},
+        "https://example.com/page",
+        ("(20% of document)",),  # 1000 / 5000 = 20%
+        (),
+        id="percentage_calculation",
+    ),
+    pytest.param(
+        {"status": "partial", "chars_returned": 0, "chars_total": 0, "next_start_index": None},
+        "https://example.com/page",
+        ("(0% of document)",),  # Divide-by-zero is handled gracefully
+        (),
+        id="percentage_zero_total",
+    ),
+]
 
-    def test_metadata_with_remaining_sections(self):
-        """Test formatting with remaining sections list."""
-        metadata = TruncationMetadata(
-            status="partial",
-            chars_returned=10000,
-            chars_total=50000,
-            next_start_index=10000,
-            remaining_sections=["Rate Limits", "Error Codes", "Webhooks"],
-        )
-        url = "https://example.com/api-docs"
-        
-        result = format_truncation_metadata(metadata, url)
-        
-        assert "Upcoming sections: Rate Limits, Error Codes, Webhooks" in result
 
-    def test_metadata_full(self):
-        """Test formatting with all fields populated."""
-        metadata = TruncationMetadata(
-            status="partial",
-            chars_returned=49800,
-            chars_total=125000,
-            next_start_index=49800,
-            current_path="Docs > API > Authentication",
-            remaining_sections=["Rate Limits", "Error Codes", "Webhooks", "Examples", "FAQ"],
-        )
-        url = "https://igloo.example.com/wiki/api-documentation"
-        
-        result = format_truncation_metadata(metadata, url)
-        
-        assert "---" in result
-        assert "⚠️ CONTENT TRUNCATED" in result
-        assert "Showing 49,800 of 125,000 chars (39% of document)" in result
-        assert "Current section: Docs > API > Authentication" in result
-        assert "Upcoming sections: Rate Limits, Error Codes, Webhooks, Examples, FAQ" in result
-        assert "To continue reading, call fetch with start_index:" in result
-        assert 'fetch(url="https://igloo.example.com/wiki/api-documentation", start_index=49800)' in result
-
-    def test_metadata_no_next_index(self):
-        """Test formatting when next_start_index is None."""
-        metadata = TruncationMetadata(
-            status="partial",
-            chars_returned=1000,
-            chars_total=5000,
-            next_start_index=None,
-        )
-        url = "https://example.com/page"
-        
-        result = format_truncation_metadata(metadata, url)
-        
-        assert "⚠️ CONTENT TRUNCATED" in result
-        assert "Showing 1,000 of 5,000 chars (20% of document)" in result
-        assert "To continue reading" not in result
+class TestFormatTruncationMetadata:
+    """Tests for the format_truncation_metadata function."""
 
-    def test_metadata_empty_remaining_sections(self):
-        """Test formatting with empty remaining sections list."""
-        metadata = TruncationMetadata(
-            status="partial",
-            chars_returned=4500,
-            chars_total=5000,
-            next_start_index=4500,
-            remaining_sections=[],
-        )
-        url = "https://example.com/page"
-        
-        result = format_truncation_metadata(metadata, url)
-        
-        assert "Upcoming sections:" not in result
+    @pytest.mark.parametrize("metadata_kwargs,url,expected,absent", TRUNCATION_CASES)
+    def test_truncation_metadata(
+        self,
+        metadata_kwargs: dict[str, Any],
+        url: str,
+        expected: tuple[str, ...],
+        absent: tuple[str, ...],
+    ):
+        """Test the notice contains the expected parts for each metadata combination."""
+        result = format_truncation_metadata(TruncationMetadata(**metadata_kwargs), url)
 
-    def test_metadata_large_numbers_formatted(self):
-        """Test that large numbers are properly formatted with commas."""
-        metadata = TruncationMetadata(
-            status="partial",
-            chars_returned=1234567,
-            chars_total=9876543,
-            next_start_index=1234567,
-        )
-        url = "https://example.com/large-doc"
-        
-        result = format_truncation_metadata(metadata, url)
-        
-        assert "Showing 1,234,567 of 9,876,543 chars" in result
-
-    def test_metadata_url_with_special_characters(self):
-        """Test formatting with URL containing special characters."""
-        metadata = TruncationMetadata(
-            status="partial",
-            chars_returned=1000,
-            chars_total=5000,
-            next_start_index=1000,
-        )
-        url = "https://example.com/page?query=test&filter=active"
-        
-        result = format_truncation_metadata(metadata, url)
-        
-        assert "To continue reading, call fetch with start_index:" in result
-        assert '  fetch(url="https://example.com/page?query=test&filter=active", start_index=1000)' in result
+        _assert_all_in(result, expected)
+        _assert_none_in(result, absent)
 
     def test_metadata_starts_with_separator(self):
         """Test that output starts with newlines and separator."""
@@ -1101,156 +962,9 @@ class TestFormatTruncationMetadata:
         assert lines[0] == ""  # Empty first line
         assert lines[1] == "---"  # Separator
 
-    def test_continuation_indentation(self):
-        """Test that fetch command in continuation instructions is indented with 2 spaces."""
-        metadata = TruncationMetadata(
-            status="partial",
-            chars_returned=1000,
-            chars_total=5000,
-            next_start_index=1000,
-            current_path="Section A",
-            remaining_sections=["Section B", "Section C"],
-        )
-        url = "https://example.com/page"
-        
-        result = format_truncation_metadata(metadata, url)
-        
-        # Should have continuation instructions with indented fetch command
-        assert "To continue reading, call fetch with start_index:" in result
-        assert '  fetch(url="https://example.com/page", start_index=1000)' in result
-        # Should NOT use table format
-        assert "|" not in result
-
-    def test_percentage_calculation(self):
-        """Test that percentage is calculated correctly."""
-        metadata = TruncationMetadata(
-            status="partial",
-            chars_returned=1000,
-            chars_total=5000,
-            next_start_index=1000,
-        )
-        url = "https://example.com/page"
-        
-        result = format_truncation_metadata(metadata, url)
-        
-        # 1000 / 5000 = 20%
-        assert "(20% of document)" in result
-
-    def test_percentage_zero_total(self):
-        """Test edge case where chars_total is 0 should return 0% without error."""
-        metadata = TruncationMetadata(
-            status="partial",
-            chars_returned=0,
-            chars_total=0,
-            next_start_index=None,
-        )
-        url = "https://example.com/page"
-        
-        result = format_truncation_metadata(metadata, url)
-        
-        # Should handle divide-by-zero gracefully
-        assert "(0% of document)" in result
-
 
-class TestFormatFetchResult:
-    """Tests for the format_fetch_result function (single page formatting)."""
-
-    def test_basic_formatting(self):
-        """Test basic fetch result formatting."""
-        result = format_fetch_result(
-            url="https://example.com/wiki/page",
-            markdown="# Title\n\nContent here.",
-        )
-        
-        assert "# Fetched Content" in result
-        assert "URL: https://example.com/wiki/page" in result
-        assert "---" in result
-        assert "# Title" in result
-        assert "Content here." in result
-
-    def test_format_without_offset(self):
-        """Test format_fetch_result without offset shows normal header."""
-        result = format_fetch_result(
-            url="https://example.com/page",
-            markdown="# Test\n\nContent here.",
-        )
-        
-        assert "URL: https://example.com/page" in result
-        assert "Reading from offset" not in result
-
-    def test_format_with_offset(self):
-        """Test format_fetch_result with offset shows position context."""
-        result = format_fetch_result(
-            url="https://example.com/page",
-            markdown="Continued content here.",
-            start_index=5000,
-        )
-        
-        assert "URL: https://example.com/page" in result
-        assert "Reading from offset: 5,000" in result
-
-    def test_format_with_zero_offset(self):
-        """Test format_fetch_result with zero offset shows no position."""
-        result = format_fetch_result(
-            url="https://example.com/page",
-            markdown="Content.",
-            start_index=0,
-        )
-        
-        assert "Reading from offset" not in result
-
-    def test_format_with_large_offset(self):
-        """Test format_fetch_result formats large offsets with commas."""
-        result = format_fetch_result(
-            url="https://example.com/page",
-            markdown="Content.",
-            start_index=1234567,
-        )
-        
-        assert "Reading from offset: 1,234,567" in result
-
-    def test_url_with_special_characters(self):
-        """Test formatting URL with query params and fragments."""
-        result = format_fetch_result(
-            url="https://example.com/page?param=value&foo=bar#section",
-            markdown="Content.",
-        )
-        
-        assert "URL: https://example.com/page?param=value&foo=bar#section" in result
-
-    def test_empty_markdown(self):
-        """Test formatting with empty markdown content."""
-        result = format_fetch_result(
-            url="https://example.com/page",
-            markdown="",
-        )
-        
-        assert "URL: https://example.com/page" in result
-        assert "---" in result
-
-    def test_unicode_content(self):
-        """Test formatting with unicode/international content."""
-        result = format_fetch_result(
-            url="https://example.com/wiki/unicode",
-            markdown="# 日本語タイトル\n\nこれは日本語のコンテンツです。",
-        )
-        
-        assert "日本語タイトル" in result
-        assert "日本語のコンテンツ" in result
-
-    def test_very_long_url(self):
-        """Test formatting with very long URL."""
-        long_url = "https://example.com/" + "a" * 500 + "/page"
-        result = format_fetch_result(
-            url=long_url,
-            markdown="Content.",
-        )
-        
-        assert f"URL: {long_url}" in result
-
-    def test_markdown_with_code_blocks(self):
-        """Test formatting markdown that contains code blocks."""
-        markdown_with_code = """# API Reference
+_LONG_URL = "https://example.com/" + "a" * 500 + "/page"
+_MARKDOWN_WITH_CODE = """# API Reference
 
 ```python
 def hello():
@@ -1259,13 +973,82 @@ def hello():
 
 More content here.
 """
-        result = format_fetch_result(
-            url="https://example.com/docs",
-            markdown=markdown_with_code,
-        )
-        
-        assert "```python" in result
-        assert 'print("Hello, World!")' in result
+
+# (format_fetch_result kwargs, substrings expected, substrings that must be absent)
+FETCH_RESULT_CASES = [
+    pytest.param(
+        {"url": "https://example.com/wiki/page", "markdown": "# Title\n\nContent here."},
+        ("# Fetched Content", "URL: https://example.com/wiki/page", "---", "# Title", "Content here."),
+        (),
+        id="basic",
+    ),
+    pytest.param(
+        {"url": "https://example.com/page", "markdown": "# Test\n\nContent here."},
+        ("URL: https://example.com/page",),
+        ("Reading from offset",),
+        id="without_offset",
+    ),
+    pytest.param(
+        {"url": "https://example.com/page", "markdown": "Continued content here.", "start_index": 5000},
+        ("URL: https://example.com/page", "Reading from offset: 5,000"),
+        (),
+        id="with_offset",
+    ),
+    pytest.param(
+        {"url": "https://example.com/page", "markdown": "Content.", "start_index": 0},
+        (),
+        ("Reading from offset",),
+        id="zero_offset",
+    ),
+    pytest.param(
+        {"url": "https://example.com/page", "markdown": "Content.", "start_index": 1234567},
+        ("Reading from offset: 1,234,567",),
+        (),
+        id="large_offset",
+    ),
+    pytest.param(
+        {"url": "https://example.com/page?param=value&foo=bar#section", "markdown": "Content."},
+        ("URL: https://example.com/page?param=value&foo=bar#section",),
+        (),
+        id="url_with_special_characters",
+    ),
+    pytest.param(
+        {"url": "https://example.com/page", "markdown": ""},
+        ("URL: https://example.com/page", "---"),
+        (),
+        id="empty_markdown",
+    ),
+    pytest.param(
+        {"url": "https://example.com/wiki/unicode", "markdown": "# 日本語タイトル\n\nこれは日本語のコンテンツです。"},
+        ("日本語タイトル", "日本語のコンテンツ"),
+        (),
+        id="unicode_content",
+    ),
+    pytest.param(
+        {"url": _LONG_URL, "markdown": "Content."},
+        (f"URL: {_LONG_URL}",),
+        (),
+        id="very_long_url",
+    ),
+    pytest.param(
+        {"url": "https://example.com/docs", "markdown": _MARKDOWN_WITH_CODE},
+        ("```python", 'print("Hello, World!")'),
+        (),
+        id="markdown_with_code_blocks",
+    ),
+]
+
+
+class TestFormatFetchResult:
+    """Tests for the format_fetch_result function (single page formatting)."""
+
+    @pytest.mark.parametrize("kwargs,expected,absent", FETCH_RESULT_CASES)
+    def test_fetch_result(self, kwargs: dict[str, Any], expected: tuple[str, ...], absent: tuple[str, ...]):
+        """Test the formatted page contains the expected parts for each input."""
+        result = format_fetch_result(**kwargs)
+
+        _assert_all_in(result, expected)
+        _assert_none_in(result, absent)
 
     def test_output_structure(self):
         """Test the overall structure of the output."""
@@ -1,3 +1,4 @@
+import asyncio
 from datetime import date
 from pathlib import Path
 from typing import AsyncGenerator
@@ -7,6 +8,7 @@ import pytest
 from httpx import Request, Response
 from pytest_mock import MockerFixture
 
+from igloo_mcp.config import Config
 from igloo_mcp.igloo import ApplicationType, IglooClient, UpdatedDateType
 
 
@@ -268,6 +270,107 @@ async def test_authenticate_session_key_missing(client: IglooClient, mocker: Moc
         await client.authenticate()
 
 
+# ============================================================================
+# Session Refresh Tests
+# ============================================================================
+
+
+async def test_request_reauthenticates_on_expired_session(
+    client: IglooClient, mock_data_path: Path, mocker: MockerFixture
+):
+    """
+    Test an expired session is refreshed and the request retried once.
+
+    Verifies that:
+    - A 401 from an API endpoint triggers re-authentication
+    - The original request is retried and its results returned
+    - The new session key is stored in cookies
+    """
+    search_url = f"{BASE_URL}/.api2/api/v1/communities/{COMMUNITY_KEY}/search/contentDetailed"
+    search_request = Request(method="GET", url=search_url)
+    auth_request = Request(method="POST", url=f"{BASE_URL}/.api/api.svc/session/create")
+    mock_request = mocker.patch.object(
+        client._client,
+        "request",
+        side_effect=[
+            Response(401, content=b"Unauthorized", request=search_request),
+            Response(200, content=(mock_data_path / "auth_success.json").read_text(), request=auth_request),
+            Response(200, content=(mock_data_path / "search_single_page.json").read_text(), request=search_request),
+        ],
+        new_callable=mocker.AsyncMock,
+    )
+
+    results = await client.search(query="Test")
+
+    assert len(results) == 6
+    assert mock_request.call_count == 3
+    assert mock_request.call_args_list[1].kwargs["method"] == "POST"
+    assert client._client.cookies.get("iglooAuth") == "cc2ba556-6d29-4091-96ce-eca12e3cbe3c"
+
+
+async def test_request_raises_when_retry_is_still_unauthorized(
+    client: IglooClient, mock_data_path: Path, mocker: MockerFixture
+):
+    """
+    Test a request that is still rejected after re-authentication raises.
+
+    Verifies that:
+    - Only one re-authentication attempt is made
+    - HTTPStatusError with status 401 is raised
+    """
+    search_url = f"{BASE_URL}/.api2/api/v1/communities/{COMMUNITY_KEY}/search/contentDetailed"
+    search_request = Request(method="GET", url=search_url)
+    auth_request = Request(method="POST", url=f"{BASE_URL}/.api/api.svc/session/create")
+    mock_request = mocker.patch.object(
+        client._client,
+        "request",
+        side_effect=[
+            Response(401, content=b"Unauthorized", request=search_request),
+            Response(200, content=(mock_data_path / "auth_success.json").read_text(), request=auth_request),
+            Response(401, content=b"Unauthorized", request=search_request),
+        ],
+        new_callable=mocker.AsyncMock,
+    )
+
+    with pytest.raises(httpx.HTTPStatusError) as exc_info:
+        await client.search(query="Test")
+
+    assert exc_info.value.response.status_code == 401
+    assert mock_request.call_count == 3
+
+
+async def test_fetch_page_reauthenticates_on_expired_session(
+    client: IglooClient, mock_data_path: Path, mocker: MockerFixture
+):
+    """
+    Test fetching a page after the session expired re-authenticates and retries.
+
+    Verifies that:
+    - A 401 from a page fetch triggers re-authentication
+    - The page is fetched again and its HTML returned
+    """
+    html_content = "<html><body><p>Test content</p></body></html>"
+    page_request = Request(method="GET", url=f"{BASE_URL}/wiki/test-page")
+    auth_request = Request(method="POST", url=f"{BASE_URL}/.api/api.svc/session/create")
+    mock_request = mocker.patch.object(
+        client._client,
+        "request",
+        side_effect=[
+            Response(401, content=b"Unauthorized", request=page_request),
+            Response(200, content=(mock_data_path / "auth_success.json").read_text(), request=auth_request),
+            Response(200, content=html_content.encode(), request=page_request),
+        ],
+        new_callable=mocker.AsyncMock,
+    )
+
+    result = await client.fetch_page(f"{BASE_URL}/wiki/test-page")
+
+    assert result == html_content
+    assert mock_request.call_count == 3
+    assert mock_request.call_args_list[1].kwargs["method"] == "POST"
+    assert mock_request.call_args_list[2].kwargs["url"] == f"{BASE_URL}/wiki/test-page"
+
+
 # ============================================================================
 # Search Tests - Basic Functionality
 # ============================================================================
@@ -408,6 +511,35 @@ async def test_search_with_limit(
     mock_request.assert_called_once()
 
 
+async def test_search_limit_below_page_size_requests_only_limit(
+    client: IglooClient, mock_data_path: Path, mocker: MockerFixture
+):
+    """
+    Test search asks the API for only `limit` results when it fits in one page.
+    
+    Verifies that:
+    - The first request's page size is reduced to the limit
+    - No further pages are requested
+    """
+    page1_content = (mock_data_path / "search_multi_page_1.json").read_text()
+    request = Request(
+        method="GET",
+        url=f"{BASE_URL}/.api2/api/v1/communities/{COMMUNITY_KEY}/search/contentDetailed",
+    )
+    mock_response_1 = Response(200, content=page1_content, request=request)
+    mock_request = mocker.patch.object(
+        client._client,
+        "request",
+        return_value=mock_response_1,
+        new_callable=mocker.AsyncMock,
+    )
+
+    await client.search(query="Test", pagination_page_size=5, limit=3)
+
+    mock_request.assert_called_once()
+    assert mock_request.call_args.kwargs["params"]["limit"] == "3"
+
+
 # ============================================================================
 # Search Tests - HTTP Error Handling
 # ============================================================================
@@ -735,6 +867,85 @@ async def test_search_concurrent_request_partial_failure(
         await client.search(query="Test", pagination_page_size=2)
 
 
+async def test_search_limits_concurrent_page_requests(mocker: MockerFixture):
+    """
+    Test search never has more pagination requests in flight than configured.
+
+    Verifies that:
+    - All pages are still fetched and combined
+    - Peak concurrency stays within max_concurrent_requests
+    """
+    client = IglooClient(
+        community=BASE_URL,
+        app_id="test_app_id",
+        app_pass="test_app_pass",
+        community_key=COMMUNITY_KEY,
+        username="test_user",
+        password="test_password",
+        max_concurrent_requests=2,
+    )
+    request = Request(
+        method="GET",
+        url=f"{BASE_URL}/.api2/api/v1/communities/{COMMUNITY_KEY}/search/contentDetailed",
+    )
+    in_flight = 0
+    peak_in_flight = 0
+
+    async def fake_request(**kwargs):
+        nonlocal in_flight, peak_in_flight
+        in_flight += 1
+        peak_in_flight = max(peak_in_flight, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return Response(200, content=b'{"numFound": 10, "results": [{"id": "1"}]}', request=request)
+
+    try:
+        mocker.patch.object(
+            client._client, "request", side_effect=fake_request, new_callable=mocker.AsyncMock
+        )
+
+        results = await client.search(query="Test", pagination_page_size=1)
+
+        assert len(results) == 10
+        assert peak_in_flight == 2
+    finally:
+        await client._client.aclose()
+
+
+async def test_search_page_failure_waits_for_sibling_pages(client: IglooClient, mocker: MockerFixture):
+    """
+    Test a failed pagination request is raised only after the other pages finish.
+    
+    Verifies that:
+    - The failing page's HTTPStatusError is raised
+    - Sibling page requests are not left running when search returns
+    """
+    request = Request(
+        method="GET",
+        url=f"{BASE_URL}/.api2/api/v1/communities/{COMMUNITY_KEY}/search/contentDetailed",
+    )
+    completed_offsets = []
+
+    async def fake_request(**kwargs):
+        offset = kwargs["params"].get("offset")
+        if offset == "1":
+            return Response(502, content=b"Bad Gateway", request=request)
+        if offset is not None:
+            for _ in range(3):
+                await asyncio.sleep(0)
+            completed_offsets.append(offset)
+        return Response(200, content=b'{"numFound": 3, "results": [{"id": "1"}]}', request=request)
+
+    mocker.patch.object(
+        client._client, "request", side_effect=fake_request, new_callable=mocker.AsyncMock
+    )
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.search(query="Test", pagination_page_size=1)
+
+    assert completed_offsets == ["2"]
+
+
 # ============================================================================
 # Fetch Page Tests
 # ============================================================================
@@ -1016,6 +1227,41 @@ async def test_fetch_pages_success(client: IglooClient, mocker: MockerFixture):
     assert results[2] == html_content_3
 
 
+async def test_fetch_pages_duplicate_urls(client: IglooClient, mocker: MockerFixture):
+    """
+    Test fetching a list with repeated URLs requests each URL only once.
+    
+    Verifies that:
+    - Each distinct URL is fetched a single time
+    - Results still line up with the input URLs, duplicates included
+    """
+    html_content_1 = "<html><body><p>Page 1</p></body></html>"
+    html_content_2 = "<html><body><p>Page 2</p></body></html>"
+    
+    request1 = Request(method="GET", url=f"{BASE_URL}/wiki/page1")
+    request2 = Request(method="GET", url=f"{BASE_URL}/wiki/page2")
+    
+    mock_response_1 = Response(200, content=html_content_1.encode(), request=request1)
+    mock_response_2 = Response(200, content=html_content_2.encode(), request=request2)
+    
+    mock_request = mocker.patch.object(
+        client._client,
+        "request",
+        side_effect=[mock_response_1, mock_response_2],
+        new_callable=mocker.AsyncMock
+    )
+
+    urls = [
+        f"{BASE_URL}/wiki/page1",
+        f"{BASE_URL}/wiki/page2",
+        f"{BASE_URL}/wiki/page1",
+    ]
+    results = await client.fetch_pages(urls)
+
+    assert mock_request.call_count == 2
+    assert results == [html_content_1, html_content_2, html_content_1]
+
+
 async def test_fetch_pages_empty_list(client: IglooClient, mocker: MockerFixture):
     """
     Test fetching with empty URL list returns empty results.
@@ -1343,6 +1589,44 @@ class TestIglooClientInitialization:
         finally:
             await client._client.aclose()
 
+    async def test_client_uses_configured_timeout(self):
+        """
+        Test IglooClient applies the configured timeout to the shared httpx client.
+
+        Verifies that:
+        - The timeout argument becomes the read timeout for requests
+        """
+        client = IglooClient(
+            community="https://test.com",
+            app_id="test_app_id",
+            app_pass="test_app_pass",
+            community_key="12345",
+            username="test_user",
+            password="test_password",
+            timeout=42.0,
+        )
+        try:
+            assert client._client.timeout.read == 42.0
+        finally:
+            await client._client.aclose()
+
+    async def test_client_default_timeout_matches_config_default(self):
+        """
+        Test IglooClient's default timeout matches the documented fetch_timeout default.
+        """
+        client = IglooClient(
+            community="https://test.com",
+            app_id="test_app_id",
+            app_pass="test_app_pass",
+            community_key="12345",
+            username="test_user",
+            password="test_password",
+        )
+        try:
+            assert client._client.timeout.read == Config.model_fields["fetch_timeout"].default
+        finally:
+            await client._client.aclose()
+
 
 # ============================================================================
 # URL Validation Tests